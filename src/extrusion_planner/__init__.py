@@ -1,6 +1,6 @@
 """Extrusion planning system for 3D printing."""
 
-from .models import HotendConfig, MaterialConfig, Segment
+from .models import HotendConfig, MaterialConfig, Segment, SegmentArray
 from .planner import ExtrusionPlanner
 
-__all__ = ["ExtrusionPlanner", "Segment", "HotendConfig", "MaterialConfig"]
+__all__ = ["ExtrusionPlanner", "Segment", "SegmentArray", "HotendConfig", "MaterialConfig"]
@@ -0,0 +1,31 @@
+"""Optional Numba JIT support with a pure-Python fallback.
+
+Set EXTRUSION_PLANNER_NO_JIT to a non-empty value to skip Numba even when it is
+installed, e.g. for fast test iteration without compile time.
+"""
+
+import os
+
+NUMBA_AVAILABLE = False
+if not os.environ.get("EXTRUSION_PLANNER_NO_JIT"):
+    try:
+        from numba import njit
+
+        NUMBA_AVAILABLE = True
+    except ImportError:  # pragma: no cover - exercised only without numba installed
+        pass
+
+if not NUMBA_AVAILABLE:
+
+    def njit(*args, **kwargs):
+        """Return the function unchanged when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+__all__ = ["NUMBA_AVAILABLE", "njit"]
@@ -51,8 +51,7 @@ def apply_preemptive_slowdown(
         prediction = predict_flow_window(buffer, hotend)
 
         if prediction and prediction.max_flow > hotend.max_volumetric_flow:
-            window = buffer.get_window()
-            window_start_index = i - len(window) + 1
+            window_start_index = i - len(buffer) + 1
             peak_global_index = window_start_index + prediction.peak_segment_index
             required_slowdown = hotend.max_volumetric_flow / prediction.max_flow
             ramp_start = max(0, peak_global_index - PREEMPTIVE_RAMPDOWN_SEGMENTS)
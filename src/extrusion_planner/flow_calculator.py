@@ -1,7 +1,10 @@
 """Volumetric flow calculation and limit checking."""
 
+import numpy as np
+
 from extrusion_planner.models.hotend import HotendConfig
 from extrusion_planner.models.segment import Segment
+from extrusion_planner.models.segment_array import SegmentArray
 
 
 def calculate_volumetric_flow(segment: Segment) -> float:
@@ -9,6 +12,11 @@ def calculate_volumetric_flow(segment: Segment) -> float:
     return segment.extrusion_rate()
 
 
+def calculate_volumetric_flows(segments: SegmentArray) -> np.ndarray:
+    """Calculate volumetric flow rate in mm³/s for every segment in a batch."""
+    return segments.extrusion_rate()
+
+
 def check_flow_limit(segment: Segment, hotend: HotendConfig) -> bool:
     """Check if segment flow exceeds hotend limit."""
     flow = calculate_volumetric_flow(segment)
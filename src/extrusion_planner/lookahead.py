@@ -2,40 +2,126 @@
 
 from collections import deque
 from dataclasses import dataclass
-from typing import List
+from typing import Iterator, List
 
-from extrusion_planner.flow_calculator import calculate_volumetric_flow
+import numpy as np
+from numpy.typing import DTypeLike
+
+from extrusion_planner._jit import NUMBA_AVAILABLE, njit
 from extrusion_planner.models.hotend import HotendConfig
 from extrusion_planner.models.segment import Segment
 
+# Below this window size, plain Python loops over the deque beat per-element NumPy
+# stores; the ring-buffer columns only pay off for large windows with the JIT kernel
+VECTORIZE_MIN_WINDOW = 32
+
+
+@njit(cache=True)
+def _window_flow_stats(
+    flows: np.ndarray,
+    travel_times: np.ndarray,
+    start: int,
+    count: int,
+    peak_index: int,
+    threshold: float,
+) -> tuple[float, float]:
+    """Single-pass (time_to_peak, high_flow_duration) over ring-buffer columns in place."""
+    size = flows.shape[0]
+    time_to_peak = 0.0
+    high_flow_duration = 0.0
+    for i in range(count):
+        slot = (start + i) % size
+        # float() keeps float32 columns accumulating in float64 when interpreted too
+        travel_time = float(travel_times[slot])
+        if i < peak_index:
+            time_to_peak += travel_time
+        if flows[slot] >= threshold:
+            high_flow_duration += travel_time
+    return time_to_peak, high_flow_duration
+
+
+if NUMBA_AVAILABLE:
+    # Compile (or load from the on-disk cache) at import so the first prediction is hot
+    _window_flow_stats(np.ones(1), np.ones(1), 0, 1, 0, 1.0)
+
 
 class LookAheadBuffer:
-    """Sliding window buffer for look-ahead segment analysis."""
+    """Sliding window buffer for look-ahead segment analysis.
+
+    Segments are kept in a deque for callers. For large windows under Numba (or a
+    non-float64 dtype) their travel times and flows are also mirrored into fixed-size
+    NumPy ring buffers so predictions run in a compiled kernel. A monotonic deque of
+    (absolute segment index, flow) pairs tracks the sliding-window flow maximum.
+    """
 
-    def __init__(self, window_size: int) -> None:
-        """Initialize look-ahead buffer with fixed window size."""
+    def __init__(self, window_size: int, dtype: DTypeLike = np.float64) -> None:
+        """Initialize look-ahead buffer with fixed window size.
+
+        dtype selects the column precision; float32 halves memory traffic for very
+        large windows at the cost of ~1e-7 relative rounding in predictions.
+        """
         if window_size <= 0:
             raise ValueError(f"window_size must be positive, got {window_size}")
         self._window_size = window_size
         self._buffer: deque[Segment] = deque(maxlen=window_size)
+        # Interpreted loops over ndarray scalars are slower than over the deque itself
+        self._vectorized = np.dtype(dtype) != np.float64 or (
+            NUMBA_AVAILABLE and window_size >= VECTORIZE_MIN_WINDOW
+        )
+        if self._vectorized:
+            self._travel_times = np.empty(window_size, dtype=dtype)
+            self._flows = np.empty(window_size, dtype=dtype)
+        # Absolute index of the oldest buffered segment
+        self._start = 0
+        # (absolute index, flow) pairs with non-increasing flow; the head is the window peak
+        self._peaks: deque[tuple[int, float]] = deque()
+        self._is_full = False
 
     @property
     def window_size(self) -> int:
         """Get window size."""
         return self._window_size
 
+    @property
+    def vectorized(self) -> bool:
+        """Whether travel times and flows are mirrored into NumPy ring buffers."""
+        return self._vectorized
+
     def add_segment(self, segment: Segment) -> None:
         """Add segment to buffer (auto-evicts oldest if full)."""
+        if len(self._buffer) == self._window_size:
+            self._drop_oldest()
+
+        index = self._start + len(self._buffer)
+        if self._vectorized:
+            slot = index % self._window_size
+            self._travel_times[slot] = segment.travel_time()
+            self._flows[slot] = segment.volumetric_flow
+            # Compare stored (possibly float32-rounded) values so equal flows stay ties
+            flow = float(self._flows[slot])
+        else:
+            flow = segment.volumetric_flow
+
+        # Strict comparison keeps the earliest of equal peaks at the head
+        peaks = self._peaks
+        while peaks and peaks[-1][1] < flow:
+            peaks.pop()
+        peaks.append((index, flow))
         self._buffer.append(segment)
+        self._is_full = len(self._buffer) == self._window_size
 
     def get_window(self) -> List[Segment]:
         """Get current window as list."""
         return list(self._buffer)
 
+    def iter_window(self) -> Iterator[Segment]:
+        """Iterate current window without copying (do not mutate while iterating)."""
+        return iter(self._buffer)
+
     def advance(self) -> None:
         """Remove oldest segment from buffer."""
         if self._buffer:
-            self._buffer.popleft()
+            self._drop_oldest()
 
     def __len__(self) -> int:
         """Get current buffer length."""
@@ -43,14 +129,55 @@ class LookAheadBuffer:
 
     def is_full(self) -> bool:
         """Check if buffer is at max capacity."""
-        return len(self._buffer) == self._window_size
+        return self._is_full
 
     def clear(self) -> None:
         """Remove all segments from buffer."""
         self._buffer.clear()
-
-
-@dataclass(frozen=True)
+        self._peaks.clear()
+        self._start = 0
+        self._is_full = False
+
+    def peak(self) -> tuple[int, float] | None:
+        """Get (window index, flow) of the first maximum-flow segment in O(1)."""
+        if not self._peaks:
+            return None
+        index, flow = self._peaks[0]
+        return index - self._start, flow
+
+    def flow_stats(self, peak_index: int, threshold: float) -> tuple[float, float]:
+        """Get (travel time before peak_index, travel time at or above threshold flow)."""
+        if self._vectorized:
+            time_to_peak, high_flow_duration = _window_flow_stats(
+                self._flows,
+                self._travel_times,
+                self._start % self._window_size,
+                len(self._buffer),
+                peak_index,
+                threshold,
+            )
+            return float(time_to_peak), float(high_flow_duration)
+
+        time_to_peak = 0.0
+        high_flow_duration = 0.0
+        for i, segment in enumerate(self._buffer):
+            travel_time = segment.travel_time()
+            if i < peak_index:
+                time_to_peak += travel_time
+            if segment.volumetric_flow >= threshold:
+                high_flow_duration += travel_time
+        return time_to_peak, high_flow_duration
+
+    def _drop_oldest(self) -> None:
+        """Evict the oldest segment and retire it from the peak tracker."""
+        self._buffer.popleft()
+        if self._peaks[0][0] == self._start:
+            self._peaks.popleft()
+        self._start += 1
+        self._is_full = False
+
+
+@dataclass(frozen=True, slots=True)
 class FlowPrediction:
     """Flow prediction analysis results."""
 
@@ -66,28 +193,14 @@ HIGH_FLOW_THRESHOLD_RATIO = 0.8
 
 def predict_flow_window(buffer: LookAheadBuffer, hotend: HotendConfig) -> FlowPrediction | None:
     """Predict flow requirements across look-ahead window."""
-    window = buffer.get_window()
-    if not window:
+    if len(buffer) == 0:
         return None
 
-    flows: List[float] = []
-    cumulative_times: List[float] = []
-    current_time = 0.0
-
-    for segment in window:
-        flows.append(calculate_volumetric_flow(segment))
-        cumulative_times.append(current_time)
-        current_time += segment.travel_time()
-
-    max_flow = max(flows)
-    peak_index = flows.index(max_flow)
-    time_to_peak = cumulative_times[peak_index]
+    peak_index, max_flow = buffer.peak()
 
     # High flow duration: sum of time spent above 80% of hotend capacity
     high_flow_threshold = hotend.max_volumetric_flow * HIGH_FLOW_THRESHOLD_RATIO
-    high_flow_duration = sum(
-        window[i].travel_time() for i, flow in enumerate(flows) if flow >= high_flow_threshold
-    )
+    time_to_peak, high_flow_duration = buffer.flow_stats(peak_index, high_flow_threshold)
 
     return FlowPrediction(
         max_flow=max_flow,
@@ -7,9 +7,11 @@ from extrusion_planner.models.material import (
     calculate_pressure_compensation_factor,
 )
 from extrusion_planner.models.segment import SECONDS_PER_MINUTE, Segment
+from extrusion_planner.models.segment_array import SegmentArray
 
 __all__ = [
     "Segment",
+    "SegmentArray",
     "HotendConfig",
     "MaterialConfig",
     "SECONDS_PER_MINUTE",
@@ -5,6 +5,11 @@ from dataclasses import dataclass
 # Shore 0 (softest) adds 80% compensation; Shore 100 (rigid) adds 0%
 MAX_ADDITIONAL_COMPENSATION = 0.8
 
+# Precomputed factors for integer Shore values 0-100 (same formula as below)
+_COMPENSATION_LOOKUP = tuple(
+    1.0 + (1.0 - shore / 100) * MAX_ADDITIONAL_COMPENSATION for shore in range(101)
+)
+
 
 def calculate_pressure_compensation_factor(shore_hardness: float) -> float:
     """Calculate pressure compensation factor from Shore hardness (0-100).
@@ -14,10 +19,12 @@ def calculate_pressure_compensation_factor(shore_hardness: float) -> float:
     """
     if not 0 <= shore_hardness <= 100:
         raise ValueError(f"shore_hardness must be between 0 and 100, got {shore_hardness}")
+    if isinstance(shore_hardness, int):
+        return _COMPENSATION_LOOKUP[shore_hardness]
     return 1.0 + (1.0 - shore_hardness / 100) * MAX_ADDITIONAL_COMPENSATION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MaterialConfig:
     """Material physical properties."""
 
@@ -9,6 +9,10 @@ SECONDS_PER_MINUTE = 60.0
 class Segment:
     """Extrusion segment with length, feed_rate, and extrusion volume."""
 
+    # Cached derived values live in plain slots, not dataclass fields, so they stay
+    # out of fields()/astuple()/asdict()
+    __slots__ = ("length", "feed_rate", "extrusion", "_travel_time", "_volumetric_flow")
+
     length: float
     feed_rate: float
     extrusion: float
@@ -21,13 +25,26 @@ class Segment:
             raise ValueError(f"feed_rate must be positive, got {self.feed_rate}")
         if self.extrusion < 0:
             raise ValueError(f"extrusion must be non-negative, got {self.extrusion}")
+        # Frozen dataclass: cache derived travel time and flow once at construction
+        travel_time = (self.length / self.feed_rate) * SECONDS_PER_MINUTE
+        object.__setattr__(self, "_travel_time", travel_time)
+        object.__setattr__(
+            self, "_volumetric_flow", self.extrusion / travel_time if self.extrusion else 0.0
+        )
+
+    def __reduce__(self) -> tuple:
+        """Pickle/copy via the constructor (frozen slots reject the default setstate)."""
+        return (type(self), (self.length, self.feed_rate, self.extrusion))
 
     def travel_time(self) -> float:
         """Travel time in seconds."""
-        return (self.length / self.feed_rate) * SECONDS_PER_MINUTE
+        return self._travel_time
+
+    @property
+    def volumetric_flow(self) -> float:
+        """Cached volumetric extrusion rate in mm³/s."""
+        return self._volumetric_flow
 
     def extrusion_rate(self) -> float:
         """Volumetric extrusion rate in mm³/s."""
-        if self.extrusion == 0:
-            return 0.0
-        return self.extrusion / self.travel_time()
+        return self._volumetric_flow
@@ -0,0 +1,105 @@
+"""Columnar (struct-of-arrays) segment batch model."""
+
+from array import array
+from dataclasses import dataclass
+from typing import Iterable, List, Union
+
+import numpy as np
+
+from extrusion_planner.models.segment import SECONDS_PER_MINUTE, Segment
+
+# Objects exposing the buffer protocol that from_buffers accepts
+BufferLike = Union[array, bytes, bytearray, memoryview, np.ndarray]
+# Untyped byte formats (e.g. struct.pack output) that may carry packed doubles
+_RAW_BYTE_FORMATS = frozenset({"B", "b", "c"})
+_FLOAT64_SIZE = np.dtype(np.float64).itemsize
+
+
+# eq=False: generated __eq__/__hash__ over ndarray fields would raise, so batches
+# compare and hash by identity
+@dataclass(frozen=True, slots=True, eq=False)
+class SegmentArray:
+    """Batch of segments stored as parallel float64 columns."""
+
+    length: np.ndarray
+    feed_rate: np.ndarray
+    extrusion: np.ndarray
+
+    def __post_init__(self) -> None:
+        """Coerce columns to float64 and validate shapes and segment parameters."""
+        # Integer columns would otherwise truncate in JIT kernels but not in NumPy;
+        # float64 inputs pass through without a copy
+        for name in ("length", "feed_rate", "extrusion"):
+            object.__setattr__(self, name, np.asarray(getattr(self, name), dtype=np.float64))
+        if not (self.length.shape == self.feed_rate.shape == self.extrusion.shape):
+            raise ValueError(
+                f"columns must have the same shape, got {self.length.shape}, "
+                f"{self.feed_rate.shape}, {self.extrusion.shape}"
+            )
+        if self.length.ndim != 1:
+            raise ValueError(f"columns must be one-dimensional, got ndim={self.length.ndim}")
+        if np.any(self.length <= 0):
+            raise ValueError("length must be positive for all segments")
+        if np.any(self.feed_rate <= 0):
+            raise ValueError("feed_rate must be positive for all segments")
+        if np.any(self.extrusion < 0):
+            raise ValueError("extrusion must be non-negative for all segments")
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[Segment]) -> "SegmentArray":
+        """Build columns from Segment objects."""
+        if not isinstance(segments, (list, tuple)):
+            segments = list(segments)
+        count = len(segments)
+        # Stream each column straight into a preallocated array, no intermediate list
+        return cls(
+            length=np.fromiter((seg.length for seg in segments), np.float64, count),
+            feed_rate=np.fromiter((seg.feed_rate for seg in segments), np.float64, count),
+            extrusion=np.fromiter((seg.extrusion for seg in segments), np.float64, count),
+        )
+
+    @classmethod
+    def from_buffers(
+        cls, length_buf: BufferLike, feed_rate_buf: BufferLike, extrusion_buf: BufferLike
+    ) -> "SegmentArray":
+        """Wrap float64 buffers (array.array('d') or packed bytes) without copying."""
+        for name, buf in (
+            ("length_buf", length_buf),
+            ("feed_rate_buf", feed_rate_buf),
+            ("extrusion_buf", extrusion_buf),
+        ):
+            view = memoryview(buf)
+            if view.format in _RAW_BYTE_FORMATS:
+                if view.nbytes % _FLOAT64_SIZE:
+                    raise ValueError(
+                        f"{name} byte length must be a multiple of {_FLOAT64_SIZE}, "
+                        f"got {view.nbytes}"
+                    )
+            elif view.format != "d":
+                raise ValueError(f"{name} must hold native float64 ('d'), got {view.format!r}")
+        return cls(
+            length=np.frombuffer(length_buf, dtype=np.float64),
+            feed_rate=np.frombuffer(feed_rate_buf, dtype=np.float64),
+            extrusion=np.frombuffer(extrusion_buf, dtype=np.float64),
+        )
+
+    def __len__(self) -> int:
+        """Get number of segments."""
+        return self.length.shape[0]
+
+    def travel_time(self) -> np.ndarray:
+        """Travel time per segment in seconds."""
+        return (self.length / self.feed_rate) * SECONDS_PER_MINUTE
+
+    def extrusion_rate(self) -> np.ndarray:
+        """Volumetric extrusion rate per segment in mm³/s (0.0 for travel moves)."""
+        return self.extrusion / self.travel_time()
+
+    def to_segments(self) -> List[Segment]:
+        """Materialize columns as Segment objects."""
+        return [
+            Segment(length=length, feed_rate=feed_rate, extrusion=extrusion)
+            for length, feed_rate, extrusion in zip(
+                self.length.tolist(), self.feed_rate.tolist(), self.extrusion.tolist()
+            )
+        ]
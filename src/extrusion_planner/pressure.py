@@ -2,15 +2,18 @@
 
 import math
 from enum import Enum
-from typing import List
+from typing import List, Optional, Sequence
 
-from extrusion_planner.flow_calculator import calculate_volumetric_flow
+import numpy as np
+
+from extrusion_planner._jit import NUMBA_AVAILABLE, njit
 from extrusion_planner.models.hotend import HotendConfig
 from extrusion_planner.models.material import (
     MaterialConfig,
     calculate_pressure_compensation_factor,
 )
 from extrusion_planner.models.segment import Segment
+from extrusion_planner.models.segment_array import SegmentArray
 
 
 class DecayModel(Enum):
@@ -36,6 +39,54 @@ PRESSURE_THRESHOLD = 0.8
 COMPENSATION_WINDOW_MULTIPLIER = 3
 
 
+# Below this many segments (or without Numba), apply_pressure_compensation scans the
+# Segment objects directly; building NumPy columns only pays off for larger batches
+VECTORIZE_MIN_SEGMENTS = 100
+
+# Integer decay codes: nopython kernels cannot dispatch on Enum members
+_EXPONENTIAL_DECAY = 0
+_LINEAR_DECAY = 1
+_DECAY_CODES = {DecayModel.EXPONENTIAL: _EXPONENTIAL_DECAY, DecayModel.LINEAR: _LINEAR_DECAY}
+
+
+@njit(cache=True)
+def _update_kernel(
+    level: float,
+    extrusion_rate: float,
+    time_delta: float,
+    decay_time_constant: float,
+    max_volumetric_flow: float,
+    decay_code: int,
+) -> float:
+    """Advance pressure level by one time step and return the new level."""
+    if time_delta <= 0:
+        return level
+
+    if extrusion_rate > 0:
+        # Pressure approaches steady state based on current extrusion rate
+        steady_state = extrusion_rate / max_volumetric_flow
+        if decay_code == _EXPONENTIAL_DECAY:
+            # Exponential approach: P(t) = P_steady + (P_current - P_steady) * e^(-t/τ)
+            approach_factor = math.exp(-time_delta / decay_time_constant)
+            level = steady_state + (level - steady_state) * approach_factor
+        elif decay_code == _LINEAR_DECAY:
+            # Linear approach: ΔP/Δt = (P_steady - P_current) / τ
+            change_rate = (steady_state - level) / decay_time_constant
+            level += change_rate * time_delta
+    else:
+        # Pressure decays during travel moves (zero extrusion)
+        if decay_code == _EXPONENTIAL_DECAY:
+            # Exponential decay: P(t) = P_current * e^(-t/τ)
+            decay_factor = math.exp(-time_delta / decay_time_constant)
+            level *= decay_factor
+        elif decay_code == _LINEAR_DECAY:
+            # Linear decay: P(t) = P_current * (1 - t/τ)
+            decay_amount = time_delta / decay_time_constant
+            level *= max(0.0, 1.0 - decay_amount)
+
+    return max(0.0, min(1.0, level))
+
+
 class PressureModel:
     """Model hotend pressure buildup and decay."""
 
@@ -50,50 +101,231 @@ class PressureModel:
         self.material = material
         self.decay_model = decay_model
         self.current_level = 0.0
-        material_factor = calculate_pressure_compensation_factor(material.shore_hardness)
+        self.material_factor = calculate_pressure_compensation_factor(material.shore_hardness)
         # Softer materials slow down pressure response
-        self.decay_time_constant = hotend.response_time * material_factor
+        self.decay_time_constant = hotend.response_time * self.material_factor
+        # Hotend is frozen, so its flow limit can be hoisted out of update()
+        self._max_volumetric_flow = hotend.max_volumetric_flow
+
+    @property
+    def decay_model(self) -> DecayModel:
+        """Pressure decay algorithm."""
+        return self._decay_model
+
+    @decay_model.setter
+    def decay_model(self, decay_model: DecayModel) -> None:
+        """Set decay algorithm and cache its kernel code."""
+        self._decay_model = decay_model
+        self._decay_code = _DECAY_CODES[decay_model]
 
     def update(self, extrusion_rate: float, time_delta: float) -> None:
         """Update pressure level based on extrusion rate and time."""
-        if time_delta <= 0:
-            return
-
-        if extrusion_rate > 0:
-            # Pressure approaches steady state based on current extrusion rate
-            steady_state = extrusion_rate / self.hotend.max_volumetric_flow
-            if self.decay_model == DecayModel.EXPONENTIAL:
-                # Exponential approach: P(t) = P_steady + (P_current - P_steady) * e^(-t/τ)
-                approach_factor = math.exp(-time_delta / self.decay_time_constant)
-                self.current_level = (
-                    steady_state + (self.current_level - steady_state) * approach_factor
-                )
-            elif self.decay_model == DecayModel.LINEAR:
-                # Linear approach: ΔP/Δt = (P_steady - P_current) / τ
-                change_rate = (steady_state - self.current_level) / self.decay_time_constant
-                self.current_level += change_rate * time_delta
-        else:
-            # Pressure decays during travel moves (zero extrusion)
-            if self.decay_model == DecayModel.EXPONENTIAL:
-                # Exponential decay: P(t) = P_current * e^(-t/τ)
-                decay_factor = math.exp(-time_delta / self.decay_time_constant)
-                self.current_level *= decay_factor
-            elif self.decay_model == DecayModel.LINEAR:
-                # Linear decay: P(t) = P_current * (1 - t/τ)
-                decay_amount = time_delta / self.decay_time_constant
-                self.current_level *= max(0.0, 1.0 - decay_amount)
-
-        self.current_level = max(0.0, min(1.0, self.current_level))
+        self.current_level = _update_kernel(
+            self.current_level,
+            float(extrusion_rate),
+            float(time_delta),
+            self.decay_time_constant,
+            self._max_volumetric_flow,
+            self._decay_code,
+        )
 
     def get_level(self) -> float:
         """Get current pressure level (0.0 to 1.0)."""
         return self.current_level
 
     def reset(self) -> None:
-        """Reset pressure to zero."""
+        """Reset pressure to zero, keeping the precomputed material constants."""
         self.current_level = 0.0
 
 
+# Integer strategy codes for the fused compensation kernel
+_MATERIAL_FACTOR_STRATEGY = 0
+_PRESSURE_LEVEL_STRATEGY = 1
+_COMBINED_STRATEGY = 2
+_STRATEGY_CODES = {
+    CompensationStrategy.MATERIAL_FACTOR: _MATERIAL_FACTOR_STRATEGY,
+    CompensationStrategy.PRESSURE_LEVEL: _PRESSURE_LEVEL_STRATEGY,
+    CompensationStrategy.COMBINED: _COMBINED_STRATEGY,
+}
+
+
+@njit(cache=True)
+def _slowdown_factor(
+    strategy_code: int,
+    pressure_level: float,
+    hotend_response_factor: float,
+    material_comp_factor: float,
+) -> float:
+    """Feed rate multiplier for a segment extruded while pressure is high."""
+    if strategy_code == _MATERIAL_FACTOR_STRATEGY:
+        # Slowdown based only on material softness
+        return 1.0 / material_comp_factor
+    elif strategy_code == _PRESSURE_LEVEL_STRATEGY:
+        # Slowdown proportional to how much pressure exceeds threshold
+        normalized_pressure = (pressure_level - PRESSURE_THRESHOLD) / (1.0 - PRESSURE_THRESHOLD)
+        return 1.0 - (0.5 * normalized_pressure)
+    elif strategy_code == _COMBINED_STRATEGY:
+        # Combine hotend response time and material softness
+        # Slower hotends + softer materials = more compensation needed
+        total_compensation = hotend_response_factor * material_comp_factor
+        return 1.0 / max(1.0, total_compensation)
+    return 1.0
+
+
+@njit(cache=True)
+def _compensate_kernel(
+    feed_rates,
+    extrusions,
+    flows,
+    travel_times,
+    decay_time_constant: float,
+    max_volumetric_flow: float,
+    hotend_response_factor: float,
+    material_comp_factor: float,
+    strategy_code: int,
+    decay_code: int,
+):
+    """Scan segments once, returning compensated feed rates.
+
+    Accepts float64 arrays (compiled) or plain float lists (interpreted fallback).
+    """
+    adjusted = feed_rates.copy()
+    # Only the pressure-level strategy depends on the level; the others are constant per scan
+    level_dependent = strategy_code == _PRESSURE_LEVEL_STRATEGY
+    constant_factor = _slowdown_factor(
+        strategy_code, PRESSURE_THRESHOLD, hotend_response_factor, material_comp_factor
+    )
+    level = 0.0
+    for i in range(len(feed_rates)):
+        # Apply slowdown when pressure exceeds threshold (0.8 = 80% of max)
+        if level > PRESSURE_THRESHOLD and extrusions[i] > 0:
+            if level_dependent:
+                adjusted[i] = feed_rates[i] * _slowdown_factor(
+                    strategy_code, level, hotend_response_factor, material_comp_factor
+                )
+            else:
+                adjusted[i] = feed_rates[i] * constant_factor
+        level = _update_kernel(
+            level, flows[i], travel_times[i], decay_time_constant, max_volumetric_flow, decay_code
+        )
+    return adjusted
+
+
+if NUMBA_AVAILABLE:
+    # Compile (or load from the on-disk cache) at import so the first real scan is hot
+    _update_kernel(0.0, 1.0, 1.0, 1.0, 1.0, _EXPONENTIAL_DECAY)
+    _ones = np.ones(1)
+    _compensate_kernel(
+        _ones, _ones, _ones, _ones, 1.0, 1.0, 1.0, 1.0, _COMBINED_STRATEGY, _EXPONENTIAL_DECAY
+    )
+    del _ones
+
+# Interpreted kernels for the plain-Python scan: per-call JIT dispatch costs more than it saves
+_update_level = getattr(_update_kernel, "py_func", _update_kernel)
+_segment_slowdown = getattr(_slowdown_factor, "py_func", _slowdown_factor)
+
+
+def _compensate_segments(
+    segments: List[Segment],
+    hotend: HotendConfig,
+    material: MaterialConfig,
+    strategy: CompensationStrategy,
+    decay_model: DecayModel,
+) -> List[Segment]:
+    """Plain-Python compensation scan over Segment objects, same arithmetic as the kernel."""
+    pressure = PressureModel(hotend, material, decay_model)
+    decay_time_constant = pressure.decay_time_constant
+    max_volumetric_flow = hotend.max_volumetric_flow
+    hotend_response_factor = hotend.response_time / BASELINE_RESPONSE_TIME
+    material_comp_factor = pressure.material_factor
+    strategy_code = _STRATEGY_CODES[strategy]
+    decay_code = _DECAY_CODES[decay_model]
+    level_dependent = strategy_code == _PRESSURE_LEVEL_STRATEGY
+    constant_factor = _segment_slowdown(
+        strategy_code, PRESSURE_THRESHOLD, hotend_response_factor, material_comp_factor
+    )
+
+    adjusted = []
+    level = 0.0
+    for segment in segments:
+        result = segment
+        if level > PRESSURE_THRESHOLD and segment.extrusion > 0:
+            if level_dependent:
+                factor = _segment_slowdown(
+                    strategy_code, level, hotend_response_factor, material_comp_factor
+                )
+            else:
+                factor = constant_factor
+            feed_rate = segment.feed_rate * factor
+            if feed_rate != segment.feed_rate:
+                result = Segment(
+                    length=segment.length, feed_rate=feed_rate, extrusion=segment.extrusion
+                )
+        adjusted.append(result)
+        level = _update_level(
+            level,
+            segment.volumetric_flow,
+            segment.travel_time(),
+            decay_time_constant,
+            max_volumetric_flow,
+            decay_code,
+        )
+    return adjusted
+
+
+def _scan_feed_rates(
+    batch: SegmentArray,
+    hotend: HotendConfig,
+    material: MaterialConfig,
+    strategy: CompensationStrategy,
+    decay_model: DecayModel,
+) -> Optional[Sequence[float]]:
+    """Run the compensation scan, or return None when no feed rate can change."""
+    # Per-segment flow and travel time are computed once, vectorized over SoA columns
+    flows = batch.extrusion_rate()
+    if not batch.extrusion.any():
+        # Pressure never builds up without extrusion
+        return None
+    if (
+        decay_model == DecayModel.EXPONENTIAL
+        and (flows / hotend.max_volumetric_flow).max() <= PRESSURE_THRESHOLD
+    ):
+        # Exponential approach never overshoots its steady state, so pressure stays
+        # at or below the highest steady state and never crosses the threshold.
+        # Compare steady states as the kernel computes them, so rounding agrees
+        return None
+
+    columns = (batch.feed_rate, batch.extrusion, flows, batch.travel_time())
+    if not NUMBA_AVAILABLE:
+        # Interpreted loops index plain lists much faster than ndarrays
+        columns = tuple(column.tolist() for column in columns)
+
+    pressure = PressureModel(hotend, material, decay_model)
+    return _compensate_kernel(
+        *columns,
+        pressure.decay_time_constant,
+        hotend.max_volumetric_flow,
+        hotend.response_time / BASELINE_RESPONSE_TIME,
+        pressure.material_factor,
+        _STRATEGY_CODES[strategy],
+        _DECAY_CODES[decay_model],
+    )
+
+
+def compensate_feed_rates(
+    segments: SegmentArray,
+    hotend: HotendConfig,
+    material: MaterialConfig,
+    strategy: CompensationStrategy = CompensationStrategy.COMBINED,
+    decay_model: DecayModel = DecayModel.EXPONENTIAL,
+) -> np.ndarray:
+    """Compensated feed rate per segment, without building Segment objects."""
+    adjusted_feed_rates = _scan_feed_rates(segments, hotend, material, strategy, decay_model)
+    if adjusted_feed_rates is None:
+        return segments.feed_rate.copy()
+    return np.asarray(adjusted_feed_rates, dtype=np.float64)
+
+
 def apply_pressure_compensation(
     segments: List[Segment],
     hotend: HotendConfig,
@@ -101,49 +333,26 @@ def apply_pressure_compensation(
     strategy: CompensationStrategy = CompensationStrategy.COMBINED,
     decay_model: DecayModel = DecayModel.EXPONENTIAL,
 ) -> List[Segment]:
-    """Apply feed rate compensation after high-flow regions."""
+    """Apply feed rate compensation after high-flow regions.
+
+    Each call starts from zero pressure. To track pressure across layers, keep one
+    PressureModel and call reset() where the state should be discarded. Callers that
+    only need the feed rates can use compensate_feed_rates() instead.
+    """
     if not segments:
         return []
+    if not NUMBA_AVAILABLE or len(segments) < VECTORIZE_MIN_SEGMENTS:
+        return _compensate_segments(segments, hotend, material, strategy, decay_model)
 
-    pressure = PressureModel(hotend, material, decay_model)
-    adjusted = []
-    material_comp_factor = calculate_pressure_compensation_factor(material.shore_hardness)
+    batch = SegmentArray.from_segments(segments)
+    adjusted_feed_rates = _scan_feed_rates(batch, hotend, material, strategy, decay_model)
+    if adjusted_feed_rates is None:
+        return list(segments)
+    adjusted_feed_rates = adjusted_feed_rates.tolist()
 
-    for segment in segments:
-        pressure_level = pressure.get_level()
-
-        # Apply slowdown when pressure exceeds threshold (0.8 = 80% of max)
-        if pressure_level > PRESSURE_THRESHOLD and segment.extrusion > 0:
-            if strategy == CompensationStrategy.MATERIAL_FACTOR:
-                # Slowdown based only on material softness
-                slowdown_factor = 1.0 / material_comp_factor
-            elif strategy == CompensationStrategy.PRESSURE_LEVEL:
-                # Slowdown proportional to how much pressure exceeds threshold
-                normalized_pressure = (pressure_level - PRESSURE_THRESHOLD) / (
-                    1.0 - PRESSURE_THRESHOLD
-                )
-                slowdown_factor = 1.0 - (0.5 * normalized_pressure)
-            elif strategy == CompensationStrategy.COMBINED:
-                # Combine hotend response time and material softness
-                # Slower hotends + softer materials = more compensation needed
-                hotend_response_factor = hotend.response_time / BASELINE_RESPONSE_TIME
-                total_compensation = hotend_response_factor * material_comp_factor
-                slowdown_factor = 1.0 / max(1.0, total_compensation)
-            else:
-                slowdown_factor = 1.0
-
-            adjusted_feed = segment.feed_rate * slowdown_factor
-            adjusted_segment = Segment(
-                length=segment.length,
-                feed_rate=adjusted_feed,
-                extrusion=segment.extrusion,
-            )
-            adjusted.append(adjusted_segment)
-        else:
-            adjusted.append(segment)
-
-        flow = calculate_volumetric_flow(segment)
-        time_delta = segment.travel_time()
-        pressure.update(flow, time_delta)
-
-    return adjusted
+    return [
+        segment
+        if feed_rate == segment.feed_rate
+        else Segment(length=segment.length, feed_rate=feed_rate, extrusion=segment.extrusion)
+        for segment, feed_rate in zip(segments, adjusted_feed_rates)
+    ]
@@ -1,6 +1,7 @@
 """Hotend and material profile presets."""
 
 from enum import Enum
+from functools import lru_cache
 
 from extrusion_planner.models.hotend import HotendConfig
 from extrusion_planner.models.material import MaterialConfig
@@ -24,29 +25,36 @@ class MaterialType(Enum):
     TPU_SHORE_30 = "tpu_shore_30"
 
 
+_HOTEND_SPECS: dict[HotendProfile, tuple[float, float]] = {
+    HotendProfile.STANDARD: (12.0, 0.08),
+    HotendProfile.FAST_RESPONSE: (15.0, 0.03),
+    HotendProfile.INDUCTION: (18.0, 0.01),
+}
+
+_MATERIAL_SPECS: dict[MaterialType, tuple[str, int]] = {
+    MaterialType.PLA: ("PLA", 75),
+    MaterialType.PETG: ("PETG", 70),
+    MaterialType.TPU_SHORE_95: ("TPU Shore 95", 95),
+    MaterialType.TPU_SHORE_60: ("TPU Shore 60", 60),
+    MaterialType.TPU_SHORE_30: ("TPU Shore 30", 30),
+}
+
+
+@lru_cache(maxsize=None)
 def create_hotend_config(profile: HotendProfile) -> HotendConfig:
-    """Create HotendConfig from predefined profile."""
-    if profile == HotendProfile.STANDARD:
-        return HotendConfig(max_volumetric_flow=12.0, response_time=0.08)
-    elif profile == HotendProfile.FAST_RESPONSE:
-        return HotendConfig(max_volumetric_flow=15.0, response_time=0.03)
-    elif profile == HotendProfile.INDUCTION:
-        return HotendConfig(max_volumetric_flow=18.0, response_time=0.01)
-    else:
-        raise ValueError(f"Unknown hotend profile: {profile}")
+    """Create HotendConfig from predefined profile (cached, configs are frozen)."""
+    try:
+        max_volumetric_flow, response_time = _HOTEND_SPECS[profile]
+    except KeyError:
+        raise ValueError(f"Unknown hotend profile: {profile}") from None
+    return HotendConfig(max_volumetric_flow=max_volumetric_flow, response_time=response_time)
 
 
+@lru_cache(maxsize=None)
 def create_material_config(material_type: MaterialType) -> MaterialConfig:
-    """Create MaterialConfig from predefined material type."""
-    if material_type == MaterialType.PLA:
-        return MaterialConfig(name="PLA", shore_hardness=75)
-    elif material_type == MaterialType.PETG:
-        return MaterialConfig(name="PETG", shore_hardness=70)
-    elif material_type == MaterialType.TPU_SHORE_95:
-        return MaterialConfig(name="TPU Shore 95", shore_hardness=95)
-    elif material_type == MaterialType.TPU_SHORE_60:
-        return MaterialConfig(name="TPU Shore 60", shore_hardness=60)
-    elif material_type == MaterialType.TPU_SHORE_30:
-        return MaterialConfig(name="TPU Shore 30", shore_hardness=30)
-    else:
-        raise ValueError(f"Unknown material type: {material_type}")
+    """Create MaterialConfig from predefined material type (cached, configs are frozen)."""
+    try:
+        name, shore_hardness = _MATERIAL_SPECS[material_type]
+    except KeyError:
+        raise ValueError(f"Unknown material type: {material_type}") from None
+    return MaterialConfig(name=name, shore_hardness=shore_hardness)
@@ -1,20 +1,43 @@
 """Visualization utilities for extrusion planning."""
 
+from dataclasses import dataclass
 from typing import List, Optional
 
 import matplotlib.pyplot as plt
 import numpy as np
 
-from extrusion_planner.models import HotendConfig, MaterialConfig, Segment
+from extrusion_planner.models import HotendConfig, MaterialConfig, Segment, SegmentArray
 from extrusion_planner.pressure import PRESSURE_THRESHOLD, DecayModel, PressureModel
 
 
-def _calculate_cumulative_time(segments: List[Segment]) -> np.ndarray:
-    """Calculate cumulative start times for each segment."""
-    times = [0.0]
-    for seg in segments[:-1]:
-        times.append(times[-1] + seg.travel_time())
-    return np.array(times)
+@dataclass(frozen=True, slots=True)
+class PlotSeries:
+    """Per-segment time series shared by the plotting functions."""
+
+    times: np.ndarray
+    travel_times: np.ndarray
+    feed_rates: np.ndarray
+    flows: np.ndarray
+
+
+def precompute_series(segments: List[Segment]) -> PlotSeries:
+    """Compute start times, feed rates and flows once for reuse across plots."""
+    batch = SegmentArray.from_segments(segments)
+    travel_times = batch.travel_time()
+    return PlotSeries(
+        times=np.concatenate(([0.0], np.cumsum(travel_times[:-1]))),
+        travel_times=travel_times,
+        feed_rates=batch.feed_rate,
+        flows=batch.extrusion_rate(),
+    )
+
+
+def _check_series(name: str, series: Optional[PlotSeries], segments: List[Segment]) -> None:
+    """Raise if precomputed series do not cover exactly the given segments."""
+    if series is not None and len(series.times) != len(segments):
+        raise ValueError(
+            f"{name} length must match segments: {len(series.times)} != {len(segments)}"
+        )
 
 
 def plot_comparison(
@@ -25,8 +48,13 @@ def plot_comparison(
     title: Optional[str] = None,
     show: bool = True,
     save_path: Optional[str] = None,
+    original_series: Optional[PlotSeries] = None,
+    adjusted_series: Optional[PlotSeries] = None,
 ) -> plt.Figure:
-    """Plot before/after comparison (feed rate, flow, pressure)."""
+    """Plot before/after comparison (feed rate, flow, pressure).
+
+    Pass series from precompute_series() to skip recomputing them per plot.
+    """
     if len(original_segments) != len(adjusted_segments):
         raise ValueError(
             f"Segment lists must be same length: "
@@ -34,22 +62,24 @@ def plot_comparison(
         )
     if not original_segments:
         raise ValueError("Cannot plot empty segment list")
+    _check_series("original_series", original_series, original_segments)
+    _check_series("adjusted_series", adjusted_series, adjusted_segments)
 
-    times_orig = _calculate_cumulative_time(original_segments)
-    times_adj = _calculate_cumulative_time(adjusted_segments)
-
-    feed_rates_orig = np.array([seg.feed_rate for seg in original_segments])
-    feed_rates_adj = np.array([seg.feed_rate for seg in adjusted_segments])
-    flows_orig = np.array([seg.extrusion_rate() for seg in original_segments])
-    flows_adj = np.array([seg.extrusion_rate() for seg in adjusted_segments])
+    if original_series is None:
+        original_series = precompute_series(original_segments)
+    if adjusted_series is None:
+        adjusted_series = precompute_series(adjusted_segments)
+    times_orig, times_adj = original_series.times, adjusted_series.times
+    feed_rates_orig, feed_rates_adj = original_series.feed_rates, adjusted_series.feed_rates
+    flows_orig, flows_adj = original_series.flows, adjusted_series.flows
 
     # Simulate pressure buildup through adjusted segments
     pressure_model = PressureModel(
         hotend=hotend, material=material, decay_model=DecayModel.EXPONENTIAL
     )
     pressure_levels = []
-    for seg in adjusted_segments:
-        pressure_model.update(seg.extrusion_rate(), seg.travel_time())
+    for flow, travel_time in zip(flows_adj.tolist(), adjusted_series.travel_times.tolist()):
+        pressure_model.update(flow, travel_time)
         pressure_levels.append(pressure_model.current_level)
     pressure_levels = np.array(pressure_levels)
 
@@ -124,17 +154,23 @@ def plot_feed_rate_only(
     title: str = "Feed Rate Comparison",
     show: bool = True,
     save_path: Optional[str] = None,
+    original_series: Optional[PlotSeries] = None,
+    adjusted_series: Optional[PlotSeries] = None,
 ) -> plt.Figure:
     """Plot simple feed rate comparison (single panel)."""
     if len(original_segments) != len(adjusted_segments):
         raise ValueError("Segment lists must be same length")
     if not original_segments:
         raise ValueError("Cannot plot empty segment list")
+    _check_series("original_series", original_series, original_segments)
+    _check_series("adjusted_series", adjusted_series, adjusted_segments)
 
-    times_orig = _calculate_cumulative_time(original_segments)
-    times_adj = _calculate_cumulative_time(adjusted_segments)
-    feed_rates_orig = np.array([seg.feed_rate for seg in original_segments])
-    feed_rates_adj = np.array([seg.feed_rate for seg in adjusted_segments])
+    if original_series is None:
+        original_series = precompute_series(original_segments)
+    if adjusted_series is None:
+        adjusted_series = precompute_series(adjusted_segments)
+    times_orig, feed_rates_orig = original_series.times, original_series.feed_rates
+    times_adj, feed_rates_adj = adjusted_series.times, adjusted_series.feed_rates
 
     fig, ax = plt.subplots(figsize=(12, 4))
     ax.step(times_orig, feed_rates_orig, where="post", label="Original", alpha=0.7)
@@ -161,13 +197,16 @@ def plot_flow_only(
     title: str = "Volumetric Flow Analysis",
     show: bool = True,
     save_path: Optional[str] = None,
+    series: Optional[PlotSeries] = None,
 ) -> plt.Figure:
     """Plot volumetric flow with hotend limit (single panel)."""
     if not segments:
         raise ValueError("Cannot plot empty segment list")
+    _check_series("series", series, segments)
 
-    times = _calculate_cumulative_time(segments)
-    flows = np.array([seg.extrusion_rate() for seg in segments])
+    if series is None:
+        series = precompute_series(segments)
+    times, flows = series.times, series.flows
 
     fig, ax = plt.subplots(figsize=(12, 4))
     ax.step(times, flows, where="post", linewidth=2, label="Volumetric Flow")
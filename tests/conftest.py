@@ -0,0 +1,52 @@
+"""Shared pytest fixtures.
+
+Hotend and material configs are frozen dataclasses, so a single instance is
+safely shared across the whole session.
+"""
+
+import pytest
+
+from extrusion_planner.models import HotendConfig, MaterialConfig
+from extrusion_planner.planner import ExtrusionPlanner
+
+_STANDARD_HOTEND_KEY = pytest.StashKey[HotendConfig]()
+_SOFT_MATERIAL_KEY = pytest.StashKey[MaterialConfig]()
+_RIGID_MATERIAL_KEY = pytest.StashKey[MaterialConfig]()
+
+
+def pytest_sessionstart(session):
+    """Build the canonical config instances once and stash them on the session config."""
+    stash = session.config.stash
+    stash[_STANDARD_HOTEND_KEY] = HotendConfig(max_volumetric_flow=12.0, response_time=0.05)
+    stash[_SOFT_MATERIAL_KEY] = MaterialConfig(name="TPU Shore 30", shore_hardness=30)
+    stash[_RIGID_MATERIAL_KEY] = MaterialConfig(name="PLA", shore_hardness=75)
+
+
+@pytest.fixture(scope="session")
+def standard_hotend(pytestconfig):
+    """Standard hotend configuration (12 mm³/s, 50ms response)."""
+    return pytestconfig.stash[_STANDARD_HOTEND_KEY]
+
+
+@pytest.fixture(scope="session")
+def soft_material(pytestconfig):
+    """Soft TPU material."""
+    return pytestconfig.stash[_SOFT_MATERIAL_KEY]
+
+
+@pytest.fixture(scope="session")
+def rigid_material(pytestconfig):
+    """Rigid PLA material."""
+    return pytestconfig.stash[_RIGID_MATERIAL_KEY]
+
+
+@pytest.fixture(scope="session")
+def default_planner():
+    """Planner with default settings (process() does not mutate planner state)."""
+    return ExtrusionPlanner()
+
+
+@pytest.fixture(scope="session")
+def small_window_planner():
+    """Planner with a two-segment look-ahead window."""
+    return ExtrusionPlanner(lookahead_window=2)
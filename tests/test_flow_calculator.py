@@ -1,10 +1,19 @@
 """Tests for volumetric flow rate calculation and limit checking."""
 
+import struct
+from array import array
+
+import numpy as np
 import pytest
 
-from extrusion_planner.flow_calculator import calculate_volumetric_flow, check_flow_limit
+from extrusion_planner.flow_calculator import (
+    calculate_volumetric_flow,
+    calculate_volumetric_flows,
+    check_flow_limit,
+)
 from extrusion_planner.models.hotend import HotendConfig
 from extrusion_planner.models.segment import Segment
+from extrusion_planner.models.segment_array import SegmentArray
 
 
 class TestCalculateVolumetricFlow:
@@ -74,6 +83,83 @@ class TestCalculateVolumetricFlow:
         assert flow_from_function == flow_from_method
 
 
+class TestCalculateVolumetricFlows:
+    """Test cases for calculate_volumetric_flows batch function."""
+
+    def test_buffers_match_per_segment_flow(self):
+        """Test flows from zero-copy buffers match per-segment calculation."""
+        lengths = array("d", [10.0, 5.0])
+        feed_rates = array("d", [60.0, 150.0])
+        extrusions = array("d", [0.5, 0.0])
+        batch = SegmentArray.from_buffers(lengths, feed_rates, extrusions)
+
+        flows = calculate_volumetric_flows(batch)
+
+        expected = [
+            calculate_volumetric_flow(Segment(length=10.0, feed_rate=60.0, extrusion=0.5)),
+            calculate_volumetric_flow(Segment(length=5.0, feed_rate=150.0, extrusion=0.0)),
+        ]
+        assert flows.tolist() == pytest.approx(expected, rel=1e-12)
+
+    def test_buffers_are_not_copied(self):
+        """Test that from_buffers shares memory with the source buffer."""
+        lengths = array("d", [10.0, 5.0])
+        batch = SegmentArray.from_buffers(
+            lengths, array("d", [60.0, 150.0]), array("d", [0.5, 0.25])
+        )
+        lengths[0] = 20.0
+        assert batch.length[0] == 20.0
+
+    def test_invalid_buffer_values_raise_error(self):
+        """Test that segment validation applies to buffer-backed batches."""
+        with pytest.raises(ValueError, match="length must be positive"):
+            SegmentArray.from_buffers(array("d", [0.0]), array("d", [60.0]), array("d", [0.5]))
+
+    def test_non_double_buffer_raises_error(self):
+        """Test that buffers not holding float64 are rejected, not reinterpreted."""
+        with pytest.raises(ValueError, match="feed_rate_buf must hold native float64"):
+            SegmentArray.from_buffers(array("d", [10.0]), array("i", [60, 0]), array("d", [0.5]))
+
+    def test_packed_byte_buffers_accepted(self):
+        """Test that struct-packed doubles in bytes/bytearray are wrapped as float64."""
+        batch = SegmentArray.from_buffers(
+            struct.pack("2d", 10.0, 5.0),
+            bytearray(struct.pack("2d", 60.0, 150.0)),
+            memoryview(struct.pack("2d", 0.5, 0.0)),
+        )
+        assert batch.length.tolist() == [10.0, 5.0]
+        assert batch.feed_rate.tolist() == [60.0, 150.0]
+        assert batch.extrusion.tolist() == [0.5, 0.0]
+
+    def test_truncated_byte_buffer_raises_error(self):
+        """Test that byte buffers not holding whole doubles are rejected."""
+        with pytest.raises(ValueError, match="extrusion_buf byte length must be a multiple of 8"):
+            SegmentArray.from_buffers(
+                struct.pack("d", 10.0), struct.pack("d", 60.0), struct.pack("d", 0.5) + b"\0"
+            )
+
+    def test_batches_compare_and_hash_by_identity(self):
+        """Test that equality and hashing do not evaluate ndarray truth values."""
+        columns = (array("d", [10.0]), array("d", [60.0]), array("d", [0.5]))
+        batch = SegmentArray.from_buffers(*columns)
+        other = SegmentArray.from_buffers(*columns)
+
+        assert batch == batch
+        assert batch != other
+        assert hash(batch) != hash(other)
+
+    def test_from_segments_round_trip(self):
+        """Test that segments survive conversion to columns and back, from any iterable."""
+        segments = [
+            Segment(length=10.0, feed_rate=60.0, extrusion=0.5),
+            Segment(length=5.0, feed_rate=150.0, extrusion=0.0),
+        ]
+        batch = SegmentArray.from_segments(iter(segments))
+
+        assert batch.feed_rate.dtype == np.float64
+        assert batch.to_segments() == segments
+
+
 class TestCheckFlowLimit:
     """Test cases for check_flow_limit function."""
 
@@ -1,5 +1,7 @@
 """Tests for HotendConfig model."""
 
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from extrusion_planner.models.hotend import HotendConfig
@@ -37,7 +39,7 @@ class TestHotendConfig:
     def test_hotend_immutability(self):
         """Test that HotendConfig is immutable (frozen dataclass)."""
         hotend = HotendConfig(max_volumetric_flow=12.0, response_time=0.05)
-        with pytest.raises(Exception):  # FrozenInstanceError in Python 3.11+
+        with pytest.raises(FrozenInstanceError):
             hotend.max_volumetric_flow = 15.0
 
     def test_standard_hotend_configuration(self):
@@ -0,0 +1,19 @@
+"""Tests for optional Numba JIT selection."""
+
+import os
+import subprocess
+import sys
+
+
+def test_no_jit_env_var_disables_numba():
+    """EXTRUSION_PLANNER_NO_JIT should force the pure-Python fallback."""
+    env = {**os.environ, "EXTRUSION_PLANNER_NO_JIT": "1"}
+    output = subprocess.run(
+        [sys.executable, "-c", "import extrusion_planner._jit as j; print(j.NUMBA_AVAILABLE)"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+    assert output.strip() == "False"
@@ -5,8 +5,12 @@ Tests are now organized in separate files: test_segment.py, test_hotend.py, test
 
 Tests can also be run by importing directly from the models package level:
     from extrusion_planner.models import Segment, HotendConfig, MaterialConfig
+
+Collection is disabled here so the re-exported classes only run from their own modules.
 """
 
+__test__ = False
+
 from tests.test_hotend import TestHotendConfig
 from tests.test_material import TestMaterialConfig
 from tests.test_segment import TestSegment
@@ -2,17 +2,23 @@
 
 import math
 
+import numpy as np
+
+from extrusion_planner import pressure
 from extrusion_planner.models.hotend import HotendConfig
 from extrusion_planner.models.material import (
     MaterialConfig,
     calculate_pressure_compensation_factor,
 )
 from extrusion_planner.models.segment import Segment
+from extrusion_planner.models.segment_array import SegmentArray
 from extrusion_planner.pressure import (
+    VECTORIZE_MIN_SEGMENTS,
     CompensationStrategy,
     DecayModel,
     PressureModel,
     apply_pressure_compensation,
+    compensate_feed_rates,
 )
 
 
@@ -27,6 +33,7 @@ class TestPressureModel:
 
         assert model.current_level == 0.0
         assert model.get_level() == 0.0
+        assert model.material_factor == calculate_pressure_compensation_factor(75)
 
     def test_pressure_buildup_during_extrusion(self):
         """Pressure should increase during high extrusion rate."""
@@ -250,6 +257,19 @@ class TestPressureModel:
         # Should increase
         assert high_pressure > low_pressure
 
+    def test_decay_model_change_takes_effect(self):
+        """Reassigning decay_model should switch the algorithm used by update()."""
+        hotend = HotendConfig(max_volumetric_flow=12.0, response_time=0.05)
+        material = MaterialConfig(name="PLA", shore_hardness=75)
+        model = PressureModel(hotend, material, DecayModel.EXPONENTIAL)
+        model.decay_model = DecayModel.LINEAR
+
+        model.update(extrusion_rate=12.0, time_delta=1.0)
+
+        # Linear approach overshoots to steady state within one long step
+        assert model.decay_model == DecayModel.LINEAR
+        assert model.get_level() == 1.0
+
 
 class TestApplyPressureCompensation:
     """Tests for apply_pressure_compensation function."""
@@ -295,6 +315,50 @@ class TestApplyPressureCompensation:
         assert result[0].feed_rate == 40.0
         assert result[1].feed_rate == 40.0
 
+    def test_below_threshold_returns_input_segments(self):
+        """Exponential decay below the threshold skips the scan and keeps segments."""
+        hotend = HotendConfig(max_volumetric_flow=12.0, response_time=0.05)
+        material = MaterialConfig(name="PLA", shore_hardness=75)
+
+        # 9.6 mm³/s is exactly 80% of max flow
+        segments = [Segment(length=10.0, feed_rate=60.0, extrusion=96.0)] * 3
+
+        result = apply_pressure_compensation(segments, hotend, material)
+
+        assert all(r is s for r, s in zip(result, segments))
+
+    def test_steady_state_rounding_above_threshold_still_compensated(self):
+        """Flow of 0.8 * max that rounds to a steady state above 0.8 must not skip the scan."""
+        hotend = HotendConfig(max_volumetric_flow=12.0, response_time=0.05)
+        material = MaterialConfig(name="PLA", shore_hardness=75)
+
+        # 0.8 * 12.0 * 10.0 / 10s = 9.600000000000001 mm³/s, steady state 0.8000000000000002
+        segments = [Segment(length=10.0, feed_rate=60.0, extrusion=0.8 * 12.0 * 10.0)] * 50
+
+        for strategy in CompensationStrategy:
+            result = apply_pressure_compensation(segments, hotend, material, strategy=strategy)
+            adjusted = [r for r, s in zip(result, segments) if r.feed_rate != s.feed_rate]
+            assert len(adjusted) == 49
+
+    def test_linear_decay_overshoot_still_compensated(self):
+        """Linear decay can overshoot its steady state, so low flow is still scanned."""
+        hotend = HotendConfig(max_volumetric_flow=12.0, response_time=0.05)
+        material = MaterialConfig(name="PLA", shore_hardness=75)
+
+        # 6 mm³/s over 10s: the linear step jumps far past the 0.5 steady state
+        segments = [Segment(length=10.0, feed_rate=60.0, extrusion=60.0)] * 2
+
+        result = apply_pressure_compensation(
+            segments,
+            hotend,
+            material,
+            strategy=CompensationStrategy.MATERIAL_FACTOR,
+            decay_model=DecayModel.LINEAR,
+        )
+
+        assert result[0].feed_rate == 60.0
+        assert result[1].feed_rate < 60.0
+
     def test_high_flow_triggers_compensation_material_factor(self):
         """High flow should trigger compensation with MATERIAL_FACTOR strategy."""
         hotend = HotendConfig(max_volumetric_flow=12.0, response_time=0.05)
@@ -747,3 +811,82 @@ class TestCombinedCompensationStrategy:
 
         # Should be identical (same strategy)
         assert result_default[1].feed_rate == result_combined[1].feed_rate
+
+
+class TestCompensateFeedRates:
+    """Tests for the array-returning compensate_feed_rates API."""
+
+    def test_matches_apply_pressure_compensation(self):
+        """Feed rates should equal those of the Segment-returning wrapper."""
+        hotend = HotendConfig(max_volumetric_flow=12.0, response_time=0.08)
+        material = MaterialConfig(name="TPU", shore_hardness=30)
+
+        segments = [
+            Segment(length=30.0, feed_rate=120.0, extrusion=210.0),  # 14 mm³/s
+            Segment(length=20.0, feed_rate=40.0, extrusion=26.0),  # 1.3 mm³/s
+        ]
+
+        for strategy in CompensationStrategy:
+            feed_rates = compensate_feed_rates(
+                SegmentArray.from_segments(segments), hotend, material, strategy=strategy
+            )
+            result = apply_pressure_compensation(segments, hotend, material, strategy=strategy)
+
+            assert feed_rates.tolist() == [segment.feed_rate for segment in result]
+
+    def test_small_batch_scan_matches_columnar_scan(self, monkeypatch):
+        """The plain-Python scan and the columnar scan should give identical segments."""
+        hotend = HotendConfig(max_volumetric_flow=12.0, response_time=0.08)
+        material = MaterialConfig(name="TPU", shore_hardness=30)
+        # Alternating high-flow, low-flow and travel segments
+        pattern = [
+            Segment(length=30.0, feed_rate=120.0, extrusion=210.0),  # 14 mm³/s
+            Segment(length=20.0, feed_rate=40.0, extrusion=26.0),  # 1.3 mm³/s
+            Segment(length=15.0, feed_rate=250.0, extrusion=0.0),  # Travel
+        ]
+        segments = pattern * (VECTORIZE_MIN_SEGMENTS // len(pattern) + 1)
+
+        for strategy in CompensationStrategy:
+            for decay_model in DecayModel:
+                monkeypatch.setattr(pressure, "VECTORIZE_MIN_SEGMENTS", 0)
+                columnar = apply_pressure_compensation(
+                    segments, hotend, material, strategy=strategy, decay_model=decay_model
+                )
+                monkeypatch.setattr(pressure, "VECTORIZE_MIN_SEGMENTS", len(segments) + 1)
+                small_batch = apply_pressure_compensation(
+                    segments, hotend, material, strategy=strategy, decay_model=decay_model
+                )
+
+                assert small_batch == columnar
+
+    def test_travel_only_returns_copy(self):
+        """Skipped scans should still return a new array of the input feed rates."""
+        hotend = HotendConfig(max_volumetric_flow=12.0, response_time=0.05)
+        material = MaterialConfig(name="TPU", shore_hardness=30)
+        batch = SegmentArray.from_segments([Segment(length=50.0, feed_rate=300.0, extrusion=0.0)])
+
+        feed_rates = compensate_feed_rates(batch, hotend, material)
+
+        assert feed_rates.tolist() == [300.0]
+        assert feed_rates is not batch.feed_rate
+
+    def test_integer_columns_match_float_columns(self):
+        """Integer-dtype columns should give the same feed rates as float64 columns."""
+        hotend = HotendConfig(max_volumetric_flow=12.0, response_time=0.08)
+        material = MaterialConfig(name="TPU", shore_hardness=30)
+        int_batch = SegmentArray(
+            length=np.array([30, 20, 20]),
+            feed_rate=np.array([120, 40, 40]),
+            extrusion=np.array([210, 26, 26]),
+        )
+        float_batch = SegmentArray(
+            length=np.array([30.0, 20.0, 20.0]),
+            feed_rate=np.array([120.0, 40.0, 40.0]),
+            extrusion=np.array([210.0, 26.0, 26.0]),
+        )
+
+        assert int_batch.feed_rate.dtype == np.float64
+        assert (
+            compensate_feed_rates(int_batch, hotend, material).tolist()
+            == compensate_feed_rates(float_batch, hotend, material).tolist()
+        )
@@ -57,6 +57,12 @@ class TestHotendProfile:
         with pytest.raises(ValueError, match="Unknown hotend profile"):
             create_hotend_config("invalid_profile")
 
+    def test_repeated_calls_return_cached_instance(self):
+        """Test that the factory returns the same frozen config per profile."""
+        assert create_hotend_config(HotendProfile.STANDARD) is create_hotend_config(
+            HotendProfile.STANDARD
+        )
+
 
 class TestMaterialType:
     """Tests for MaterialType enum and create_material_config factory."""
@@ -126,6 +132,10 @@ class TestMaterialType:
         with pytest.raises(ValueError, match="Unknown material type"):
             create_material_config("invalid_material")
 
+    def test_repeated_calls_return_cached_instance(self):
+        """Test that the factory returns the same frozen config per material."""
+        assert create_material_config(MaterialType.PLA) is create_material_config(MaterialType.PLA)
+
 
 class TestProfileCombinations:
     """Tests for common hotend + material combinations."""
@@ -1,5 +1,8 @@
 """Tests for Segment model."""
 
+import pickle
+from dataclasses import FrozenInstanceError, astuple, fields
+
 import pytest
 
 from extrusion_planner.models.segment import Segment
@@ -22,104 +25,76 @@ class TestSegment:
         assert seg.feed_rate == 150.0
         assert seg.extrusion == 0.0
 
-    def test_negative_length_raises_error(self):
-        """Test that negative length raises ValueError."""
-        with pytest.raises(ValueError, match="length must be positive"):
-            Segment(length=-5.0, feed_rate=90.0, extrusion=0.48)
-
-    def test_zero_length_raises_error(self):
-        """Test that zero length raises ValueError."""
-        with pytest.raises(ValueError, match="length must be positive"):
-            Segment(length=0.0, feed_rate=90.0, extrusion=0.48)
-
-    def test_negative_feed_rate_raises_error(self):
-        """Test that negative feed_rate raises ValueError."""
-        with pytest.raises(ValueError, match="feed_rate must be positive"):
-            Segment(length=12.0, feed_rate=-90.0, extrusion=0.48)
-
-    def test_zero_feed_rate_raises_error(self):
-        """Test that zero feed_rate raises ValueError."""
-        with pytest.raises(ValueError, match="feed_rate must be positive"):
-            Segment(length=12.0, feed_rate=0.0, extrusion=0.48)
-
-    def test_negative_extrusion_raises_error(self):
-        """Test that negative extrusion raises ValueError."""
-        with pytest.raises(ValueError, match="extrusion must be non-negative"):
-            Segment(length=12.0, feed_rate=90.0, extrusion=-0.5)
-
-    def test_travel_time_calculation(self):
-        """Test travel_time() returns correct value in seconds.
-
-        For a segment with length=12.0mm and feed_rate=90.0mm/min:
-        travel_time = (12.0 / 90.0) * 60 = 8.0 seconds
-        """
-        seg = Segment(length=12.0, feed_rate=90.0, extrusion=0.48)
-        assert seg.travel_time() == pytest.approx(8.0)
-
-    def test_travel_time_high_speed(self):
-        """Test travel_time() for high-speed movement.
-
-        For length=5.0mm and feed_rate=150.0mm/min:
-        travel_time = (5.0 / 150.0) * 60 = 2.0 seconds
-        """
-        seg = Segment(length=5.0, feed_rate=150.0, extrusion=0.25)
-        assert seg.travel_time() == pytest.approx(2.0)
-
-    def test_extrusion_rate_calculation(self):
-        """Test extrusion_rate() returns correct volumetric flow in mm³/s.
-
-        For segment with extrusion=0.48mm³ and travel_time=8.0s:
-        extrusion_rate = 0.48 / 8.0 = 0.06 mm³/s
-        """
-        seg = Segment(length=12.0, feed_rate=90.0, extrusion=0.48)
-        assert seg.extrusion_rate() == pytest.approx(0.06)
-
-    def test_extrusion_rate_high_flow(self):
-        """Test extrusion_rate() for high flow scenario.
-
-        For segment with extrusion=0.25mm³ and travel_time=2.0s:
-        extrusion_rate = 0.25 / 2.0 = 0.125 mm³/s
-        """
-        seg = Segment(length=5.0, feed_rate=150.0, extrusion=0.25)
-        assert seg.extrusion_rate() == pytest.approx(0.125)
-
-    def test_extrusion_rate_for_travel_move(self):
-        """Test extrusion_rate() returns 0.0 for travel moves (extrusion=0)."""
-        seg = Segment(length=10.0, feed_rate=150.0, extrusion=0.0)
-        assert seg.extrusion_rate() == 0.0
+    @pytest.mark.parametrize(
+        "length,feed_rate,extrusion,msg",
+        [
+            (-5.0, 90.0, 0.48, "length must be positive"),
+            (0.0, 90.0, 0.48, "length must be positive"),
+            (12.0, -90.0, 0.48, "feed_rate must be positive"),
+            (12.0, 0.0, 0.48, "feed_rate must be positive"),
+            (12.0, 90.0, -0.5, "extrusion must be non-negative"),
+        ],
+    )
+    def test_invalid_parameters_raise_error(self, length, feed_rate, extrusion, msg):
+        """Test that non-positive length/feed_rate or negative extrusion raise ValueError."""
+        with pytest.raises(ValueError, match=msg):
+            Segment(length=length, feed_rate=feed_rate, extrusion=extrusion)
+
+    @pytest.mark.parametrize(
+        "length,feed_rate,extrusion,expected_travel_time,expected_rate",
+        [
+            (12.0, 90.0, 0.48, 8.0, 0.06),  # Typical PLA segment
+            (5.0, 150.0, 0.25, 2.0, 0.125),  # High-speed, high flow
+            (10.0, 150.0, 0.0, 4.0, 0.0),  # Travel move
+            (20.0, 60.0, 0.5, 20.0, 0.025),  # Realistic 1mm/s printing
+            (0.1, 30.0, 0.001, 0.2, 0.005),  # Very small segment
+            (1000.0, 120.0, 50.0, 500.0, 0.1),  # Very long segment
+        ],
+    )
+    def test_travel_time_and_extrusion_rate(
+        self, length, feed_rate, extrusion, expected_travel_time, expected_rate
+    ):
+        """Test travel_time = length / feed_rate * 60 and extrusion_rate = extrusion / time."""
+        seg = Segment(length=length, feed_rate=feed_rate, extrusion=extrusion)
+        assert seg.travel_time() == pytest.approx(expected_travel_time)
+        assert seg.extrusion_rate() == pytest.approx(expected_rate)
 
     def test_segment_immutability(self):
         """Test that Segment is immutable (frozen dataclass)."""
         seg = Segment(length=12.0, feed_rate=90.0, extrusion=0.48)
-        with pytest.raises(Exception):  # FrozenInstanceError in Python 3.11+
+        with pytest.raises(FrozenInstanceError):
             seg.length = 15.0
 
-    def test_realistic_printing_segment(self):
-        """Test with realistic 3D printing values.
+    def test_cached_travel_time_excluded_from_equality_and_repr(self):
+        """Test that the cached travel time does not leak into eq/repr."""
+        seg1 = Segment(length=12.0, feed_rate=90.0, extrusion=0.48)
+        seg2 = Segment(length=12.0, feed_rate=90.0, extrusion=0.48)
+        assert seg1 == seg2
+        assert hash(seg1) == hash(seg2)
+        assert repr(seg1) == "Segment(length=12.0, feed_rate=90.0, extrusion=0.48)"
 
-        Typical extrusion segment:
-        - 20mm length
-        - 60mm/min feed rate (1mm/s)
-        - 0.5mm³ extrusion volume
-        - Expected travel time: 20 seconds
-        - Expected flow rate: 0.025 mm³/s
-        """
-        seg = Segment(length=20.0, feed_rate=60.0, extrusion=0.5)
-        assert seg.travel_time() == pytest.approx(20.0)
-        assert seg.extrusion_rate() == pytest.approx(0.025)
+    def test_segment_uses_slots(self):
+        """Test that Segment instances have no per-instance __dict__."""
+        seg = Segment(length=12.0, feed_rate=90.0, extrusion=0.48)
+        assert not hasattr(seg, "__dict__")
 
-    def test_edge_case_very_small_segment(self):
-        """Test with very small but valid segment."""
-        seg = Segment(length=0.1, feed_rate=30.0, extrusion=0.001)
-        # travel_time = (0.1 / 30.0) * 60 = 0.2 seconds
-        assert seg.travel_time() == pytest.approx(0.2)
-        # extrusion_rate = 0.001 / 0.2 = 0.005 mm³/s
-        assert seg.extrusion_rate() == pytest.approx(0.005)
+    def test_cached_values_are_not_dataclass_fields(self):
+        """Test that cached derived values stay out of fields() and astuple()."""
+        seg = Segment(length=12.0, feed_rate=90.0, extrusion=0.48)
+        assert [f.name for f in fields(seg)] == ["length", "feed_rate", "extrusion"]
+        assert astuple(seg) == (12.0, 90.0, 0.48)
 
-    def test_edge_case_very_long_segment(self):
-        """Test with very long segment."""
-        seg = Segment(length=1000.0, feed_rate=120.0, extrusion=50.0)
-        # travel_time = (1000.0 / 120.0) * 60 = 500 seconds
-        assert seg.travel_time() == pytest.approx(500.0)
-        # extrusion_rate = 50.0 / 500.0 = 0.1 mm³/s
-        assert seg.extrusion_rate() == pytest.approx(0.1)
+    def test_pickle_round_trip_keeps_cache(self):
+        """Test that unpickled segments are equal and carry their cached values."""
+        seg = Segment(length=12.0, feed_rate=90.0, extrusion=0.48)
+        restored = pickle.loads(pickle.dumps(seg))
+        assert restored == seg
+        assert restored.travel_time() == seg.travel_time()
+        assert restored.volumetric_flow == seg.volumetric_flow
+
+    def test_volumetric_flow_matches_extrusion_rate(self):
+        """Test cached volumetric_flow property matches extrusion_rate()."""
+        seg = Segment(length=12.0, feed_rate=90.0, extrusion=0.48)
+        travel = Segment(length=10.0, feed_rate=150.0, extrusion=0.0)
+        assert seg.volumetric_flow == seg.extrusion_rate() == pytest.approx(0.06)
+        assert travel.volumetric_flow == 0.0
@@ -1,6 +1,7 @@
 """Tests for visualization utilities."""
 
 import matplotlib
+import numpy as np
 import pytest
 
 # Use non-interactive backend for testing
@@ -8,108 +9,211 @@ matplotlib.use("Agg")
 
 import matplotlib.pyplot as plt
 
-from extrusion_planner.models import HotendConfig, MaterialConfig, Segment
+from extrusion_planner.models import Segment
 from extrusion_planner.visualize import (
     plot_comparison,
     plot_feed_rate_only,
     plot_flow_only,
+    precompute_series,
 )
 
+# Immutable sample data shared by all tests (frozen Segments in tuples)
+_SEGMENTS = (
+    Segment(length=10.0, feed_rate=100.0, extrusion=0.3),
+    Segment(length=5.0, feed_rate=150.0, extrusion=0.5),
+    Segment(length=10.0, feed_rate=100.0, extrusion=0.3),
+)
+# Same segments with slightly lower feed rates
+_ADJUSTED = (
+    Segment(length=10.0, feed_rate=90.0, extrusion=0.3),
+    Segment(length=5.0, feed_rate=120.0, extrusion=0.5),
+    Segment(length=10.0, feed_rate=85.0, extrusion=0.3),
+)
+# Two printing segments with increasing feed rate
+_TWO_SEGMENTS = (
+    Segment(length=10.0, feed_rate=100.0, extrusion=0.3),
+    Segment(length=10.0, feed_rate=120.0, extrusion=0.4),
+)
+_SINGLE = (Segment(length=10.0, feed_rate=100.0, extrusion=0.3),)
+_SINGLE_ADJUSTED = (Segment(length=10.0, feed_rate=90.0, extrusion=0.3),)
+
+
+# Tests only check figure metadata, never pixels: keep layout and path work minimal.
+# Figures are closed after each test, so don't warn about open ones.
+_TEST_RC_PARAMS = {
+    "figure.max_open_warning": 0,
+    "figure.autolayout": False,
+    "axes.grid": False,
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+}
+
+
+@pytest.fixture(autouse=True)
+def _isolate_plot_state():
+    """Apply the test rcParams for this test only and close every figure it opened."""
+    with matplotlib.rc_context(_TEST_RC_PARAMS):
+        yield
+        plt.close("all")
+
+
+@pytest.fixture(scope="session")
+def planned_data(default_planner, standard_hotend, rigid_material):
+    """Planner input and output shared by the integration tests."""
+    # Middle segment is high flow (20 mm³ in 1.5s)
+    original = [
+        Segment(length=10.0, feed_rate=100.0, extrusion=0.3),
+        Segment(length=5.0, feed_rate=200.0, extrusion=20.0),
+        Segment(length=10.0, feed_rate=100.0, extrusion=0.3),
+    ]
+    adjusted = default_planner.process(original, standard_hotend, rigid_material)
+    return original, adjusted, standard_hotend, rigid_material
+
+
+class TestInvalidInput:
+    """Test input validation shared by all plotting functions."""
+
+    @pytest.mark.parametrize(
+        "plot",
+        [
+            pytest.param(
+                lambda hotend, material: plot_comparison([], [], hotend, material, show=False),
+                id="comparison",
+            ),
+            pytest.param(
+                lambda hotend, material: plot_feed_rate_only([], [], show=False),
+                id="feed_rate_only",
+            ),
+            pytest.param(
+                lambda hotend, material: plot_flow_only([], hotend, show=False),
+                id="flow_only",
+            ),
+        ],
+    )
+    def test_empty_segments_raise_error(self, plot, standard_hotend, rigid_material):
+        """Test that empty segment lists raise error."""
+        with pytest.raises(ValueError, match="Cannot plot empty segment list"):
+            plot(standard_hotend, rigid_material)
+
+    @pytest.mark.parametrize(
+        "plot",
+        [
+            pytest.param(
+                lambda orig, adj, hotend, material: plot_comparison(
+                    orig, adj, hotend, material, show=False
+                ),
+                id="comparison",
+            ),
+            pytest.param(
+                lambda orig, adj, hotend, material: plot_feed_rate_only(orig, adj, show=False),
+                id="feed_rate_only",
+            ),
+        ],
+    )
+    def test_mismatched_lengths_raise_error(self, plot, standard_hotend, rigid_material):
+        """Test that mismatched segment lists raise error."""
+        with pytest.raises(ValueError, match="Segment lists must be same length"):
+            plot(_TWO_SEGMENTS, _SINGLE_ADJUSTED, standard_hotend, rigid_material)
+
+    @pytest.mark.parametrize(
+        "plot, name",
+        [
+            pytest.param(
+                lambda series, hotend, material: plot_comparison(
+                    _SEGMENTS, _ADJUSTED, hotend, material, show=False, original_series=series
+                ),
+                "original_series",
+                id="comparison_original",
+            ),
+            pytest.param(
+                lambda series, hotend, material: plot_comparison(
+                    _SEGMENTS, _ADJUSTED, hotend, material, show=False, adjusted_series=series
+                ),
+                "adjusted_series",
+                id="comparison_adjusted",
+            ),
+            pytest.param(
+                lambda series, hotend, material: plot_feed_rate_only(
+                    _SEGMENTS, _ADJUSTED, show=False, original_series=series
+                ),
+                "original_series",
+                id="feed_rate_only_original",
+            ),
+            pytest.param(
+                lambda series, hotend, material: plot_feed_rate_only(
+                    _SEGMENTS, _ADJUSTED, show=False, adjusted_series=series
+                ),
+                "adjusted_series",
+                id="feed_rate_only_adjusted",
+            ),
+            pytest.param(
+                lambda series, hotend, material: plot_flow_only(
+                    _SEGMENTS, hotend, show=False, series=series
+                ),
+                "series",
+                id="flow_only",
+            ),
+        ],
+    )
+    def test_mismatched_series_raise_error(self, plot, name, standard_hotend, rigid_material):
+        """Test that precomputed series of the wrong length raise error."""
+        series = precompute_series(_TWO_SEGMENTS)
+        with pytest.raises(ValueError, match=f"^{name} length must match segments: 2 != 3"):
+            plot(series, standard_hotend, rigid_material)
+
 
 class TestPlotComparison:
     """Test plot_comparison function."""
 
-    @pytest.fixture
-    def segments(self):
-        """Sample segments for testing."""
-        return [
-            Segment(length=10.0, feed_rate=100.0, extrusion=0.3),
-            Segment(length=5.0, feed_rate=150.0, extrusion=0.5),
-            Segment(length=10.0, feed_rate=100.0, extrusion=0.3),
-        ]
-
-    @pytest.fixture
-    def adjusted_segments(self):
-        """Adjusted segments (slightly different feed rates)."""
-        return [
-            Segment(length=10.0, feed_rate=90.0, extrusion=0.3),
-            Segment(length=5.0, feed_rate=120.0, extrusion=0.5),
-            Segment(length=10.0, feed_rate=85.0, extrusion=0.3),
-        ]
-
-    @pytest.fixture
-    def hotend(self):
-        """Standard hotend config."""
-        return HotendConfig(max_volumetric_flow=12.0, response_time=0.05)
-
-    @pytest.fixture
-    def material(self):
-        """Standard material config."""
-        return MaterialConfig(name="PLA", shore_hardness=75)
-
-    def test_plot_comparison_creates_figure(self, segments, adjusted_segments, hotend, material):
-        """Test that plot_comparison creates a valid figure."""
-        fig = plot_comparison(segments, adjusted_segments, hotend, material, show=False)
-        assert isinstance(fig, plt.Figure)
-        plt.close(fig)
-
-    def test_plot_comparison_has_three_subplots(
-        self, segments, adjusted_segments, hotend, material
-    ):
-        """Test that figure has 3 subplots."""
-        fig = plot_comparison(segments, adjusted_segments, hotend, material, show=False)
-        assert len(fig.axes) == 3
-        plt.close(fig)
-
-    def test_plot_comparison_with_custom_title(self, segments, adjusted_segments, hotend, material):
-        """Test custom title."""
+    def test_plot_comparison_basic_properties(self, standard_hotend, rigid_material):
+        """Test figure type, three subplots and custom title from a single plot."""
         custom_title = "My Custom Title"
         fig = plot_comparison(
-            segments, adjusted_segments, hotend, material, title=custom_title, show=False
+            _SEGMENTS,
+            _ADJUSTED,
+            standard_hotend,
+            rigid_material,
+            title=custom_title,
+            show=False,
         )
+        assert isinstance(fig, plt.Figure)
+        assert len(fig.axes) == 3
         assert custom_title in fig._suptitle.get_text()
-        plt.close(fig)
 
-    def test_plot_comparison_empty_segments_raises_error(self, hotend, material):
-        """Test that empty segments raise error."""
-        with pytest.raises(ValueError, match="Cannot plot empty segment list"):
-            plot_comparison([], [], hotend, material, show=False)
-
-    def test_plot_comparison_mismatched_lengths_raises_error(self, segments, hotend, material):
-        """Test that mismatched segment lists raise error."""
-        with pytest.raises(ValueError, match="Segment lists must be same length"):
-            plot_comparison(segments, segments[:2], hotend, material, show=False)
-
-    def test_plot_comparison_single_segment(self, hotend, material):
+    def test_plot_comparison_single_segment(self, standard_hotend, rigid_material):
         """Test plotting single segment."""
-        single_orig = [Segment(length=10.0, feed_rate=100.0, extrusion=0.3)]
-        single_adj = [Segment(length=10.0, feed_rate=90.0, extrusion=0.3)]
-
-        fig = plot_comparison(single_orig, single_adj, hotend, material, show=False)
-        assert isinstance(fig, plt.Figure)
-        plt.close(fig)
+        fig = plot_comparison(
+            _SINGLE, _SINGLE_ADJUSTED, standard_hotend, rigid_material, show=False
+        )
+        feed_ax, flow_ax, pressure_ax = fig.axes
+        # Original + adjusted steps; flow panel adds the hotend limit, pressure its threshold
+        assert [len(ax.get_lines()) for ax in fig.axes] == [2, 3, 2]
+        assert [line.get_ydata().tolist() for line in feed_ax.get_lines()] == [[100.0], [90.0]]
+        assert "Extrusion Planning Analysis" in fig._suptitle.get_text()
 
-    def test_plot_comparison_with_travel_moves(self, hotend, material):
+    def test_plot_comparison_with_travel_moves(self, standard_hotend, rigid_material):
         """Test plotting segments including travel moves."""
+        # Middle segment is a travel move (no extrusion)
         segments_with_travel = [
             Segment(length=10.0, feed_rate=100.0, extrusion=0.3),
-            Segment(length=20.0, feed_rate=300.0, extrusion=0.0),  # Travel
+            Segment(length=20.0, feed_rate=300.0, extrusion=0.0),
             Segment(length=10.0, feed_rate=100.0, extrusion=0.3),
         ]
 
         fig = plot_comparison(
-            segments_with_travel, segments_with_travel, hotend, material, show=False
+            segments_with_travel, segments_with_travel, standard_hotend, rigid_material, show=False
         )
-        assert isinstance(fig, plt.Figure)
-        plt.close(fig)
+        assert len(fig.axes) == 3
+        original_flow, adjusted_flow, _limit = fig.axes[1].get_lines()
+        # Travel move shows as a zero-flow step on both curves
+        assert original_flow.get_ydata()[1] == adjusted_flow.get_ydata()[1] == 0.0
+        assert adjusted_flow.get_xdata().tolist() == [0.0, 6.0, 10.0]
 
-    def test_plot_comparison_soft_material(self, segments, adjusted_segments, hotend):
+    def test_plot_comparison_soft_material(self, standard_hotend, soft_material):
         """Test plotting with soft material."""
-        soft_material = MaterialConfig(name="TPU Shore 30", shore_hardness=30)
-        fig = plot_comparison(segments, adjusted_segments, hotend, soft_material, show=False)
+        fig = plot_comparison(_SEGMENTS, _ADJUSTED, standard_hotend, soft_material, show=False)
         # Material info should appear in title
         assert "Shore 30" in fig._suptitle.get_text()
-        plt.close(fig)
 
 
 class TestPlotFeedRateOnly:
@@ -117,138 +221,98 @@ class TestPlotFeedRateOnly:
 
     def test_plot_feed_rate_only_creates_figure(self):
         """Test basic functionality."""
-        orig = [
-            Segment(length=10.0, feed_rate=100.0, extrusion=0.3),
-            Segment(length=10.0, feed_rate=120.0, extrusion=0.4),
-        ]
         adj = [
             Segment(length=10.0, feed_rate=90.0, extrusion=0.3),
             Segment(length=10.0, feed_rate=110.0, extrusion=0.4),
         ]
 
-        fig = plot_feed_rate_only(orig, adj, show=False)
-        assert isinstance(fig, plt.Figure)
+        fig = plot_feed_rate_only(_TWO_SEGMENTS, adj, show=False)
         assert len(fig.axes) == 1
-        plt.close(fig)
+        ax = fig.axes[0]
+        assert ax.get_title() == "Feed Rate Comparison"
+        assert [line.get_label() for line in ax.get_lines()] == ["Original", "Adjusted"]
+        assert ax.get_lines()[1].get_ydata().tolist() == [90.0, 110.0]
 
     def test_plot_feed_rate_only_with_custom_title(self):
         """Test custom title."""
-        orig = [Segment(length=10.0, feed_rate=100.0, extrusion=0.3)]
-        adj = [Segment(length=10.0, feed_rate=90.0, extrusion=0.3)]
-
         custom_title = "Custom Feed Rate Plot"
-        fig = plot_feed_rate_only(orig, adj, title=custom_title, show=False)
+        fig = plot_feed_rate_only(_SINGLE, _SINGLE_ADJUSTED, title=custom_title, show=False)
         assert custom_title == fig.axes[0].get_title()
-        plt.close(fig)
-
-    def test_plot_feed_rate_only_empty_raises_error(self):
-        """Test empty segments raise error."""
-        with pytest.raises(ValueError, match="Cannot plot empty segment list"):
-            plot_feed_rate_only([], [], show=False)
-
-    def test_plot_feed_rate_only_mismatched_lengths_raises_error(self):
-        """Test mismatched lengths raise error."""
-        orig = [
-            Segment(length=10.0, feed_rate=100.0, extrusion=0.3),
-            Segment(length=10.0, feed_rate=120.0, extrusion=0.4),
-        ]
-        adj = [Segment(length=10.0, feed_rate=90.0, extrusion=0.3)]
-
-        with pytest.raises(ValueError, match="Segment lists must be same length"):
-            plot_feed_rate_only(orig, adj, show=False)
 
 
 class TestPlotFlowOnly:
     """Test plot_flow_only function."""
 
-    def test_plot_flow_only_creates_figure(self):
+    def test_plot_flow_only_creates_figure(self, standard_hotend):
         """Test basic functionality."""
-        segments = [
-            Segment(length=10.0, feed_rate=100.0, extrusion=0.3),
-            Segment(length=5.0, feed_rate=150.0, extrusion=0.5),
-        ]
-        hotend = HotendConfig(max_volumetric_flow=12.0, response_time=0.05)
-
-        fig = plot_flow_only(segments, hotend, show=False)
+        fig = plot_flow_only(_SEGMENTS[:2], standard_hotend, show=False)
         assert isinstance(fig, plt.Figure)
         assert len(fig.axes) == 1
-        plt.close(fig)
 
-    def test_plot_flow_only_with_custom_title(self):
+    def test_plot_flow_only_with_custom_title(self, standard_hotend):
         """Test custom title."""
-        segments = [Segment(length=10.0, feed_rate=100.0, extrusion=0.3)]
-        hotend = HotendConfig(max_volumetric_flow=12.0, response_time=0.05)
-
         custom_title = "Custom Flow Plot"
-        fig = plot_flow_only(segments, hotend, title=custom_title, show=False)
+        fig = plot_flow_only(_SINGLE, standard_hotend, title=custom_title, show=False)
         assert custom_title == fig.axes[0].get_title()
-        plt.close(fig)
 
-    def test_plot_flow_only_empty_raises_error(self):
-        """Test empty segments raise error."""
-        hotend = HotendConfig(max_volumetric_flow=12.0, response_time=0.05)
+    def test_plot_flow_only_shows_hotend_limit(self, standard_hotend):
+        """Test that hotend limit line is plotted."""
+        fig = plot_flow_only(_SINGLE, standard_hotend, show=False)
+        ax = fig.axes[0]
+
+        # Check that there are horizontal lines (hotend limit); orig=False avoids copies
+        lines = ax.get_lines()
+        sizes = np.fromiter(
+            (np.size(line.get_xdata(orig=False)) for line in lines),
+            dtype=np.int64,
+            count=len(lines),
+        )
+        assert (sizes > 1).sum() >= 1  # At least the hotend limit line
 
-        with pytest.raises(ValueError, match="Cannot plot empty segment list"):
-            plot_flow_only([], hotend, show=False)
 
-    def test_plot_flow_only_shows_hotend_limit(self):
-        """Test that hotend limit line is plotted."""
-        segments = [Segment(length=10.0, feed_rate=100.0, extrusion=0.3)]
-        hotend = HotendConfig(max_volumetric_flow=12.0, response_time=0.05)
+class TestPrecomputeSeries:
+    """Test precompute_series helper."""
 
-        fig = plot_flow_only(segments, hotend, show=False)
-        ax = fig.axes[0]
+    def test_series_match_segments(self):
+        """Test start times, feed rates and flows derived from segments."""
+        series = precompute_series(_SEGMENTS)
 
-        # Check that there are horizontal lines (hotend limit)
-        hlines = [line for line in ax.get_lines() if len(line.get_xdata()) > 1]
-        assert len(hlines) >= 1  # At least the hotend limit line
-        plt.close(fig)
+        assert series.times.tolist() == [0.0, 6.0, 8.0]
+        assert series.feed_rates.tolist() == [seg.feed_rate for seg in _SEGMENTS]
+        assert series.flows.tolist() == [seg.extrusion_rate() for seg in _SEGMENTS]
 
 
 class TestVisualizationIntegration:
     """Integration tests with real planner output."""
 
-    def test_plot_with_planner_output(self):
+    def test_plot_with_planner_output(self, planned_data):
         """Test plotting actual planner results."""
-        from extrusion_planner.planner import ExtrusionPlanner
-
-        original = [
-            Segment(length=10.0, feed_rate=100.0, extrusion=0.3),
-            Segment(length=5.0, feed_rate=200.0, extrusion=20.0),  # High flow
-            Segment(length=10.0, feed_rate=100.0, extrusion=0.3),
-        ]
-
-        hotend = HotendConfig(max_volumetric_flow=12.0, response_time=0.05)
-        material = MaterialConfig(name="PLA", shore_hardness=75)
-
-        planner = ExtrusionPlanner()
-        adjusted = planner.process(original, hotend, material)
+        original, adjusted, hotend, material = planned_data
 
         # Should be able to plot without errors
         fig = plot_comparison(original, adjusted, hotend, material, show=False)
         assert isinstance(fig, plt.Figure)
-        plt.close(fig)
 
-    def test_plot_all_three_utilities(self):
+    def test_plot_all_three_utilities(self, planned_data):
         """Test all three plotting functions with same data."""
-        segments = [
-            Segment(length=10.0, feed_rate=100.0, extrusion=0.3),
-            Segment(length=10.0, feed_rate=120.0, extrusion=0.4),
-        ]
-        adjusted = [
-            Segment(length=10.0, feed_rate=95.0, extrusion=0.3),
-            Segment(length=10.0, feed_rate=115.0, extrusion=0.4),
-        ]
-        hotend = HotendConfig(max_volumetric_flow=12.0, response_time=0.05)
-        material = MaterialConfig(name="PETG", shore_hardness=70)
+        original, adjusted, hotend, material = planned_data
+        # Derive the time/feed/flow series once and share them across all three plots
+        orig_series = precompute_series(original)
+        adj_series = precompute_series(adjusted)
 
         # All three should work
-        fig1 = plot_comparison(segments, adjusted, hotend, material, show=False)
-        fig2 = plot_feed_rate_only(segments, adjusted, show=False)
-        fig3 = plot_flow_only(segments, hotend, show=False)
+        fig1 = plot_comparison(
+            original,
+            adjusted,
+            hotend,
+            material,
+            show=False,
+            original_series=orig_series,
+            adjusted_series=adj_series,
+        )
+        fig2 = plot_feed_rate_only(
+            original, adjusted, show=False, original_series=orig_series, adjusted_series=adj_series
+        )
+        fig3 = plot_flow_only(original, hotend, show=False, series=orig_series)
 
         assert all(isinstance(f, plt.Figure) for f in [fig1, fig2, fig3])
-
-        plt.close(fig1)
-        plt.close(fig2)
-        plt.close(fig3)